@@ -4,62 +4,128 @@ from typing import Generic, Optional, TypeVar
 from typedb.analyze import Pipeline, Constraint
 from typedb.driver import ConceptRow
 from .data_constraint import (
-    DataConstraint,
+    DataConstraint, _variable_name,
     Isa, Has, Links, Is, Is, Iid,
     Sub, Owns, Relates, Plays, Label, Kind, Value,
     Expression, FunctionCall, Comparison,
+    KIND_ISA, KIND_HAS, KIND_LINKS, KIND_SUB, KIND_OWNS, KIND_RELATES, KIND_PLAYS,
+    KIND_FUNCTION_CALL, KIND_EXPRESSION, KIND_IS, KIND_IID, KIND_COMPARISON,
+    KIND_KIND_OF, KIND_LABEL, KIND_VALUE,
 )
 
 OutputType = TypeVar("OutputType")
 
 
 class TypeDBAnswerConverter(ABC, Generic[OutputType]):
+    # Subclasses whose add_* methods ignore some constraint kinds can narrow
+    # this to skip building DataConstraint objects for them entirely.
+    # None means every kind is of interest.
+    INTERESTED_KINDS: Optional[frozenset] = None
+
     def __init__(self, pipeline: Pipeline):
         self.pipeline = pipeline
+        # Variable names are fixed per pipeline, so one shared map serves every
+        # answer row: each distinct variable costs a single pipeline lookup.
+        self._variable_names: dict = {}
+        # Bound-method dispatch keyed on the constraint's KIND tag; binding here
+        # picks up subclass overrides of the add_* methods.
+        self._adders = {
+            KIND_ISA: self.add_isa,
+            KIND_HAS: self.add_has,
+            KIND_LINKS: self.add_links,
+            KIND_SUB: self.add_sub,
+            KIND_OWNS: self.add_owns,
+            KIND_RELATES: self.add_relates,
+            KIND_PLAYS: self.add_plays,
+            KIND_FUNCTION_CALL: self.add_function_call,
+            KIND_EXPRESSION: self.add_expression,
+            KIND_IS: self.add_is,
+            KIND_IID: self.add_iid,
+            KIND_COMPARISON: self.add_comparison,
+            KIND_KIND_OF: self.add_kind,
+            KIND_LABEL: self.add_label,
+            KIND_VALUE: self.add_value,
+        }
 
     def add_answer(self, answer_index: Optional[int], row: ConceptRow):
-        involved_conjunctions = [self.pipeline.conjunction(i) for i in row.involved_conjunctions()]
-        involved_constraints = [constraint for conjunction in involved_conjunctions for constraint in
-                                conjunction.constraints()]
-        data_constraints_with_none = [DataConstraint.of(self.pipeline, constraint, answer_index, row) for constraint in
-                                      involved_constraints]
-        data_constraints = [dc for dc in data_constraints_with_none if dc]
-        for dc in data_constraints:
-            self._add_constraint(dc)
+        self.consume_row((constraint
+                          for i in row.involved_conjunctions()
+                          for constraint in self.pipeline.conjunction(i).constraints()),
+                         answer_index, row)
+
+    def consume_row(self, constraints, answer_index: Optional[int], row: ConceptRow):
+        """
+        Streams one row's constraints into the converter through the fused
+        apply_* hooks. Nothing is accumulated: only the current constraint's
+        resolution state is live, so peak memory stays flat regardless of how
+        many rows an answer stream contains.
+        """
+        vertex_cache = {}  # per-row: the same variable is resolved once across all constraints
+        pipeline = self.pipeline
+        names = self._variable_names
+        interested = self.INTERESTED_KINDS
+        apply_to = DataConstraint.apply_to
+        for constraint in constraints:
+            apply_to(pipeline, constraint, answer_index, row, self, vertex_cache, names, interested)
+
+    def _variable_name(self, variable) -> Optional[str]:
+        return _variable_name(self.pipeline, variable, self._variable_names)
 
     def _add_constraint(self, constraint: DataConstraint):
-        if constraint.is_isa():
-            self.add_isa(constraint.as_isa())
-        elif constraint.is_has():
-            self.add_has(constraint.as_has())
-        elif constraint.is_links():
-            self.add_links(constraint.as_links())
-        elif constraint.is_sub():
-            self.add_sub(constraint.as_sub())
-        elif constraint.is_owns():
-            self.add_owns(constraint.as_owns())
-        elif constraint.is_relates():
-            self.add_relates(constraint.as_relates())
-        elif constraint.is_plays():
-            self.add_plays(constraint.as_plays())
-        elif constraint.is_function_call():
-            self.add_function_call(constraint.as_function_call())
-        elif constraint.is_expression():
-            self.add_expression(constraint.as_expression())
-        elif constraint.is_is():
-            self.add_is(constraint.as_is())
-        elif constraint.is_iid():
-            self.add_iid(constraint.as_iid())
-        elif constraint.is_comparison():
-            self.add_comparison(constraint.as_comparison())
-        elif constraint.is_kind_of():
-            self.add_kind(constraint.as_kind())
-        elif constraint.is_label():
-            self.add_label(constraint.as_label())
-        elif constraint.is_value():
-            self.add_value(constraint.as_value())
-        else:
+        adder = self._adders.get(constraint.KIND)
+        if adder is None:
             raise TypeError("Unsupported constraint variant: %s" % (type(constraint),))
+        adder(constraint)
+
+    # Fused per-kind hooks: DataConstraint.apply_to resolves a constraint's
+    # vertices and hands the fields straight to these. The defaults build the
+    # DataConstraint object and defer to the matching add_* method, so
+    # converters that only implement add_* keep working; converters on a hot
+    # path can override apply_* and skip the object entirely.
+    def apply_isa(self, constraint: Constraint, answer_index: Optional[int], instance, type_, exactness):
+        self.add_isa(Isa(constraint, answer_index, instance, type_, exactness))
+
+    def apply_has(self, constraint: Constraint, answer_index: Optional[int], owner, attribute, exactness):
+        self.add_has(Has(constraint, answer_index, owner, attribute, exactness))
+
+    def apply_links(self, constraint: Constraint, answer_index: Optional[int], relation, player, role, exactness):
+        self.add_links(Links(constraint, answer_index, relation, player, role, exactness))
+
+    def apply_sub(self, constraint: Constraint, answer_index: Optional[int], subtype, supertype, exactness):
+        self.add_sub(Sub(constraint, answer_index, subtype, supertype, exactness))
+
+    def apply_owns(self, constraint: Constraint, answer_index: Optional[int], owner, attribute, exactness):
+        self.add_owns(Owns(constraint, answer_index, owner, attribute, exactness))
+
+    def apply_relates(self, constraint: Constraint, answer_index: Optional[int], relation, role, exactness):
+        self.add_relates(Relates(constraint, answer_index, relation, role, exactness))
+
+    def apply_plays(self, constraint: Constraint, answer_index: Optional[int], player, role, exactness):
+        self.add_plays(Plays(constraint, answer_index, player, role, exactness))
+
+    def apply_function_call(self, constraint: Constraint, answer_index: Optional[int], call_vertex, arguments, assigned):
+        self.add_function_call(FunctionCall(constraint, answer_index, call_vertex, arguments, assigned))
+
+    def apply_expression(self, constraint: Constraint, answer_index: Optional[int], expr_vertex, arguments, assigned):
+        self.add_expression(Expression(constraint, answer_index, expr_vertex, arguments, assigned))
+
+    def apply_is(self, constraint: Constraint, answer_index: Optional[int], lhs, rhs):
+        self.add_is(Is(constraint, answer_index, lhs, rhs))
+
+    def apply_iid(self, constraint: Constraint, answer_index: Optional[int], variable, iid_value):
+        self.add_iid(Iid(constraint, answer_index, variable, iid_value))
+
+    def apply_comparison(self, constraint: Constraint, answer_index: Optional[int], lhs, rhs, comparator):
+        self.add_comparison(Comparison(constraint, answer_index, lhs, rhs, comparator))
+
+    def apply_kind(self, constraint: Constraint, answer_index: Optional[int], kind_enum, type_):
+        self.add_kind(Kind(constraint, answer_index, kind_enum, type_))
+
+    def apply_label(self, constraint: Constraint, answer_index: Optional[int], variable, label_value):
+        self.add_label(Label(constraint, answer_index, variable, label_value))
+
+    def apply_value(self, constraint: Constraint, answer_index: Optional[int], attribute_type, value_type):
+        self.add_value(Value(constraint, answer_index, attribute_type, value_type))
 
     @abstractmethod
     def finish(self) -> OutputType:
@@ -1,3 +1,4 @@
+import weakref
 from abc import ABC
 
 from typedb.analyze import Pipeline, Constraint, ConstraintVertex  # , Variable
@@ -8,279 +9,613 @@ from typing import List, Optional
 
 
 class DataVertex(ABC):
-    pass
+    __slots__ = ()
 
 
 class ConceptVertex(DataVertex):
-    def __init__(self, concept: Concept):
-        self.concept = concept
+    # Interning cache: equal concepts share one vertex instance, so downstream
+    # graph insertion hashes and compares mostly by identity. Weak values let
+    # vertices die with the graphs that reference them.
+    _interned = weakref.WeakValueDictionary()
+
+    __slots__ = ("concept", "_hash", "__weakref__")
+
+    def __new__(cls, concept: Concept):
+        vertex = cls._interned.get(concept)
+        if vertex is None:
+            vertex = super().__new__(cls)
+            vertex.concept = concept
+            vertex._hash = hash(concept)
+            cls._interned[concept] = vertex
+        return vertex
 
     def __hash__(self):
-        return hash(self.concept)
+        return self._hash
 
     def __eq__(self, other):
         if other is self:
             return True
-        if other is None or not isinstance(other, self.__class__):
+        # These are closed variants, never subclassed: an exact type check is
+        # cheaper than the isinstance MRO walk and also covers None.
+        if type(other) is not type(self):
             return False
         return self.concept == other.concept
 
-    def __ne__(self, other):
-        return not (self == other)
-
     def __repr__(self):
         return self.concept.__repr__()
 
 
 class NamedRoleVertex(DataVertex):
-    def __init__(self, variable, name: str):  # TODO: Type annotate variable: Variable
-        self._name = name
-        self._variable = variable
+    _interned = weakref.WeakValueDictionary()
+
+    __slots__ = ("_name", "_variable", "_hash", "__weakref__")
+
+    def __new__(cls, variable, name: str):  # TODO: Type annotate variable: Variable
+        # Driver variable ids are pipeline-scoped and restart per query, so the
+        # cache key must include the name to keep vertices from one pipeline
+        # out of another's graphs while both are alive.
+        key = (variable, name)
+        vertex = cls._interned.get(key)
+        if vertex is None:
+            vertex = super().__new__(cls)
+            vertex._name = name
+            vertex._variable = variable
+            vertex._hash = hash(variable)
+            cls._interned[key] = vertex
+        return vertex
 
     def name(self):
         return self._name
 
     def __hash__(self):
-        return hash(self._variable)
+        return self._hash
 
     def __eq__(self, other):
         if other is self:
             return True
-        if other is None or not isinstance(other, self.__class__):
+        if type(other) is not type(self):
             return False
         return self._variable == other._variable
 
-    def __ne__(self, other):
-        return not (self == other)
-
     def __repr__(self):
         return f"RoleVertex({self.name})"
 
 
 class FunctionCallVertex(DataVertex):
+    __slots__ = ("name", "assigned", "arguments", "_hash")
+
     def __init__(self, name: str, assigned: List[ConceptVertex], arguments: List[ConceptVertex]):
         self.name = name
         self.assigned = tuple(assigned)
         self.arguments = tuple(arguments)
+        self._hash = hash((self.name, self.assigned, self.arguments))
 
     def __hash__(self):
-        return hash((self.name, self.assigned, self.arguments))
+        return self._hash
 
     def __eq__(self, other):
         if other is self:
             return True
-        if other is None or not isinstance(other, self.__class__):
+        if type(other) is not type(self):
             return False
         return (self.name, self.assigned, self.arguments) == (other.name, other.assigned, other.arguments)
 
-    def __ne__(self, other):
-        return not (self == other)
-
     def __repr__(self):
         return f"Func({self.assigned} = {self.name}[{self.arguments}])"
 
 
 class ExpressionVertex(DataVertex):
+    __slots__ = ("text", "assigned", "arguments", "_hash")
+
     def __init__(self, text: str, assigned: ConceptVertex, arguments: List[ConceptVertex]):
         self.text = text
         self.arguments = tuple(arguments)
         self.assigned = assigned
+        self._hash = hash((self.text, self.assigned, self.arguments))
 
     def __hash__(self):
-        return hash((self.text, self.assigned, self.arguments))
+        return self._hash
 
     def __eq__(self, other):
         if other is self:
             return True
-        if other is None or not isinstance(other, self.__class__):
+        if type(other) is not type(self):
             return False
         return (self.text, self.assigned, self.arguments) == (other.text, other.assigned, other.arguments)
 
-    def __ne__(self, other):
-        return not (self == other)
-
     def __repr__(self):
         return f"Expr({self.text})"
         # return f"Expr({self.text}, {self.assigned}, [{self.arguments}])"
 
 
-def resolve_constraint_vertex(pipeline: Pipeline, vertex: ConstraintVertex, concept_row: ConceptRow) -> Optional[DataVertex]:
+# Sentinel distinguishing "not cached" from a cached None resolution.
+_CACHE_MISS = object()
+
+
+def _variable_name(pipeline: Pipeline, variable, names: Optional[dict]) -> Optional[str]:
+    """Looks up a variable's name, consulting/filling `names` when provided.
+
+    Variable names are a property of the pipeline, not of any answer row, so a
+    single map shared across rows reduces pipeline lookups to one per distinct
+    variable.
+    """
+    if names is None:
+        return pipeline.get_variable_name(variable)
+    name = names.get(variable, _CACHE_MISS)
+    if name is _CACHE_MISS:
+        name = names[variable] = pipeline.get_variable_name(variable)
+    return name
+
+
+def resolve_constraint_vertex(pipeline: Pipeline, vertex: ConstraintVertex, concept_row: ConceptRow,
+                              cache: Optional[dict] = None, names: Optional[dict] = None) -> Optional[DataVertex]:
+    """
+    Resolves a constraint vertex against a single answer row.
+
+    The same variable typically appears in many constraints of one row (isa, has,
+    links, ...), so callers may pass a per-row `cache` to resolve each variable
+    only once instead of re-querying the pipeline and row every time, and a
+    pipeline-lifetime `names` map to resolve each variable's name only once.
+    """
     if vertex.is_label():
         return ConceptVertex(vertex.as_label())
     elif vertex.is_variable():
-        var_name = pipeline.get_variable_name(vertex.as_variable())
-        return ConceptVertex(concept_row.get(var_name)) if var_name else None
+        variable = vertex.as_variable()
+        key = ("var", variable)
+        if cache is not None:
+            hit = cache.get(key, _CACHE_MISS)
+            if hit is not _CACHE_MISS:
+                return hit
+        var_name = _variable_name(pipeline, variable, names)
+        resolved = ConceptVertex(concept_row.get(var_name)) if var_name else None
+        if cache is not None:
+            cache[key] = resolved
+        return resolved
     elif vertex.is_value():
         return ConceptVertex(vertex.as_value())
     elif vertex.is_named_role():
-        return NamedRoleVertex(vertex.as_named_role().variable(), vertex.as_named_role().name())
+        named_role = vertex.as_named_role()
+        variable = named_role.variable()
+        key = ("role", variable)
+        if cache is not None:
+            hit = cache.get(key, _CACHE_MISS)
+            if hit is not _CACHE_MISS:
+                return hit
+        resolved = NamedRoleVertex(variable, named_role.name())
+        if cache is not None:
+            cache[key] = resolved
+        return resolved
     else:
         return None
 
 
+def _build_isa(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, cache: Optional[dict] = None,
+               names: Optional[dict] = None) -> "Isa":
+    isa = constraint.as_isa()
+    instance = resolve_constraint_vertex(pipeline, isa.instance(), concept_row, cache, names)
+    type_ = resolve_constraint_vertex(pipeline, isa.type(), concept_row, cache, names)
+    exactness = isa.exactness()
+    return Isa(constraint, answer_index, instance, type_, exactness)
+
+
+def _build_has(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, cache: Optional[dict] = None,
+               names: Optional[dict] = None) -> "Has":
+    has = constraint.as_has()
+    owner = resolve_constraint_vertex(pipeline, has.owner(), concept_row, cache, names)
+    attribute = resolve_constraint_vertex(pipeline, has.attribute(), concept_row, cache, names)
+    exactness = has.exactness()
+    return Has(constraint, answer_index, owner, attribute, exactness)
+
+
+def _build_links(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, cache: Optional[dict] = None,
+                 names: Optional[dict] = None) -> "Links":
+    links = constraint.as_links()
+    relation = resolve_constraint_vertex(pipeline, links.relation(), concept_row, cache, names)
+    player = resolve_constraint_vertex(pipeline, links.player(), concept_row, cache, names)
+    role = resolve_constraint_vertex(pipeline, links.role(), concept_row, cache, names)
+    exactness = links.exactness()
+    return Links(constraint, answer_index, relation, player, role, exactness)
+
+
+def _build_sub(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, cache: Optional[dict] = None,
+               names: Optional[dict] = None) -> "Sub":
+    sub = constraint.as_sub()
+    subtype = resolve_constraint_vertex(pipeline, sub.subtype(), concept_row, cache, names)
+    supertype = resolve_constraint_vertex(pipeline, sub.supertype(), concept_row, cache, names)
+    exactness = sub.exactness()
+    return Sub(constraint, answer_index, subtype, supertype, exactness)
+
+
+def _build_owns(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                concept_row: ConceptRow, cache: Optional[dict] = None,
+                names: Optional[dict] = None) -> "Owns":
+    owns = constraint.as_owns()
+    owner = resolve_constraint_vertex(pipeline, owns.owner(), concept_row, cache, names)
+    attribute = resolve_constraint_vertex(pipeline, owns.attribute(), concept_row, cache, names)
+    exactness = owns.exactness()
+    return Owns(constraint, answer_index, owner, attribute, exactness)
+
+
+def _build_relates(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                   concept_row: ConceptRow, cache: Optional[dict] = None,
+                   names: Optional[dict] = None) -> "Relates":
+    relates = constraint.as_relates()
+    relation = resolve_constraint_vertex(pipeline, relates.relation(), concept_row, cache, names)
+    role = resolve_constraint_vertex(pipeline, relates.role(), concept_row, cache, names)
+    exactness = relates.exactness()
+    return Relates(constraint, answer_index, relation, role, exactness)
+
+
+def _build_plays(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, cache: Optional[dict] = None,
+                 names: Optional[dict] = None) -> "Plays":
+    plays = constraint.as_plays()
+    player = resolve_constraint_vertex(pipeline, plays.player(), concept_row, cache, names)
+    role = resolve_constraint_vertex(pipeline, plays.role(), concept_row, cache, names)
+    exactness = plays.exactness()
+    return Plays(constraint, answer_index, player, role, exactness)
+
+
+def _build_function_call(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                         concept_row: ConceptRow, cache: Optional[dict] = None,
+                         names: Optional[dict] = None) -> "FunctionCall":
+    fc = constraint.as_function_call()
+    name = fc.name()
+    arguments = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in fc.arguments()]
+    assigned = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in fc.assigned()]
+    fc_vertex = FunctionCallVertex(name, assigned, arguments)
+    return FunctionCall(constraint, answer_index, fc_vertex, arguments, assigned)
+
+
+def _build_expression(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                      concept_row: ConceptRow, cache: Optional[dict] = None,
+                      names: Optional[dict] = None) -> "Expression":
+    expr = constraint.as_expression()
+    text = expr.text()
+    arguments = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in expr.arguments()]
+    assigned = resolve_constraint_vertex(pipeline, expr.assigned(), concept_row, cache, names)
+    expr_vertex = ExpressionVertex(text, assigned, arguments)
+    return Expression(constraint, answer_index, expr_vertex, arguments, assigned)
+
+
+def _build_is(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+              concept_row: ConceptRow, cache: Optional[dict] = None,
+              names: Optional[dict] = None) -> "Is":
+    isc = constraint.as_is()
+    lhs = resolve_constraint_vertex(pipeline, isc.lhs(), concept_row, cache, names)
+    rhs = resolve_constraint_vertex(pipeline, isc.rhs(), concept_row, cache, names)
+    return Is(constraint, answer_index, lhs, rhs)
+
+
+def _build_iid(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, cache: Optional[dict] = None,
+               names: Optional[dict] = None) -> "Iid":
+    iid = constraint.as_iid()
+    variable = resolve_constraint_vertex(pipeline, iid.variable(), concept_row, cache, names)
+    iid_value = iid.iid()
+    return Iid(constraint, answer_index, variable, iid_value)
+
+
+def _build_comparison(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                      concept_row: ConceptRow, cache: Optional[dict] = None,
+                      names: Optional[dict] = None) -> "Comparison":
+    comp = constraint.as_comparison()
+    lhs = resolve_constraint_vertex(pipeline, comp.lhs(), concept_row, cache, names)
+    rhs = resolve_constraint_vertex(pipeline, comp.rhs(), concept_row, cache, names)
+    comparator = comp.comparator()
+    return Comparison(constraint, answer_index, lhs, rhs, comparator)
+
+
+def _build_kind(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                concept_row: ConceptRow, cache: Optional[dict] = None,
+                names: Optional[dict] = None) -> "Kind":
+    kindc = constraint.as_kind()
+    kind_enum = kindc.kind()
+    type_ = resolve_constraint_vertex(pipeline, kindc.type(), concept_row, cache, names)
+    return Kind(constraint, answer_index, kind_enum, type_)
+
+
+def _build_label(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, cache: Optional[dict] = None,
+                 names: Optional[dict] = None) -> "Label":
+    label = constraint.as_label()
+    variable = resolve_constraint_vertex(pipeline, label.variable(), concept_row, cache, names)
+    label_value = label.label()
+    return Label(constraint, answer_index, variable, label_value)
+
+
+def _build_value(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, cache: Optional[dict] = None,
+                 names: Optional[dict] = None) -> "Value":
+    val = constraint.as_value()
+    attribute_type = resolve_constraint_vertex(pipeline, val.attribute_type(), concept_row, cache, names)
+    value_type = val.value_type()
+    return Value(constraint, answer_index, attribute_type, value_type)
+
+
+
+def _apply_isa(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    isa = constraint.as_isa()
+    builder.apply_isa(constraint, answer_index,
+                      resolve_constraint_vertex(pipeline, isa.instance(), concept_row, cache, names),
+                      resolve_constraint_vertex(pipeline, isa.type(), concept_row, cache, names),
+                      isa.exactness())
+
+
+def _apply_has(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    has = constraint.as_has()
+    builder.apply_has(constraint, answer_index,
+                      resolve_constraint_vertex(pipeline, has.owner(), concept_row, cache, names),
+                      resolve_constraint_vertex(pipeline, has.attribute(), concept_row, cache, names),
+                      has.exactness())
+
+
+def _apply_links(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    links = constraint.as_links()
+    builder.apply_links(constraint, answer_index,
+                        resolve_constraint_vertex(pipeline, links.relation(), concept_row, cache, names),
+                        resolve_constraint_vertex(pipeline, links.player(), concept_row, cache, names),
+                        resolve_constraint_vertex(pipeline, links.role(), concept_row, cache, names),
+                        links.exactness())
+
+
+def _apply_sub(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    sub = constraint.as_sub()
+    builder.apply_sub(constraint, answer_index,
+                      resolve_constraint_vertex(pipeline, sub.subtype(), concept_row, cache, names),
+                      resolve_constraint_vertex(pipeline, sub.supertype(), concept_row, cache, names),
+                      sub.exactness())
+
+
+def _apply_owns(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    owns = constraint.as_owns()
+    builder.apply_owns(constraint, answer_index,
+                       resolve_constraint_vertex(pipeline, owns.owner(), concept_row, cache, names),
+                       resolve_constraint_vertex(pipeline, owns.attribute(), concept_row, cache, names),
+                       owns.exactness())
+
+
+def _apply_relates(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                   concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    relates = constraint.as_relates()
+    builder.apply_relates(constraint, answer_index,
+                          resolve_constraint_vertex(pipeline, relates.relation(), concept_row, cache, names),
+                          resolve_constraint_vertex(pipeline, relates.role(), concept_row, cache, names),
+                          relates.exactness())
+
+
+def _apply_plays(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    plays = constraint.as_plays()
+    builder.apply_plays(constraint, answer_index,
+                        resolve_constraint_vertex(pipeline, plays.player(), concept_row, cache, names),
+                        resolve_constraint_vertex(pipeline, plays.role(), concept_row, cache, names),
+                        plays.exactness())
+
+
+def _apply_function_call(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                         concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    fc = constraint.as_function_call()
+    arguments = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in fc.arguments()]
+    assigned = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in fc.assigned()]
+    builder.apply_function_call(constraint, answer_index,
+                                FunctionCallVertex(fc.name(), assigned, arguments), arguments, assigned)
+
+
+def _apply_expression(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                      concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    expr = constraint.as_expression()
+    arguments = [resolve_constraint_vertex(pipeline, v, concept_row, cache, names) for v in expr.arguments()]
+    assigned = resolve_constraint_vertex(pipeline, expr.assigned(), concept_row, cache, names)
+    builder.apply_expression(constraint, answer_index,
+                             ExpressionVertex(expr.text(), assigned, arguments), arguments, assigned)
+
+
+def _apply_is(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+              concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    isc = constraint.as_is()
+    builder.apply_is(constraint, answer_index,
+                     resolve_constraint_vertex(pipeline, isc.lhs(), concept_row, cache, names),
+                     resolve_constraint_vertex(pipeline, isc.rhs(), concept_row, cache, names))
+
+
+def _apply_iid(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+               concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    iid = constraint.as_iid()
+    builder.apply_iid(constraint, answer_index,
+                      resolve_constraint_vertex(pipeline, iid.variable(), concept_row, cache, names),
+                      iid.iid())
+
+
+def _apply_comparison(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                      concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    comp = constraint.as_comparison()
+    builder.apply_comparison(constraint, answer_index,
+                             resolve_constraint_vertex(pipeline, comp.lhs(), concept_row, cache, names),
+                             resolve_constraint_vertex(pipeline, comp.rhs(), concept_row, cache, names),
+                             comp.comparator())
+
+
+def _apply_kind(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    kindc = constraint.as_kind()
+    builder.apply_kind(constraint, answer_index, kindc.kind(),
+                       resolve_constraint_vertex(pipeline, kindc.type(), concept_row, cache, names))
+
+
+def _apply_label(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    label = constraint.as_label()
+    builder.apply_label(constraint, answer_index,
+                        resolve_constraint_vertex(pipeline, label.variable(), concept_row, cache, names),
+                        label.label())
+
+
+def _apply_value(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, builder, cache: Optional[dict], names: Optional[dict]):
+    val = constraint.as_value()
+    builder.apply_value(constraint, answer_index,
+                        resolve_constraint_vertex(pipeline, val.attribute_type(), concept_row, cache, names),
+                        val.value_type())
+
+
+def _probe_handler(constraint: Constraint):
+    """Run the is_* predicates once for a constraint to find its dispatch entry."""
+    if constraint.is_isa():
+        return KIND_ISA, _build_isa, _apply_isa
+    elif constraint.is_has():
+        return KIND_HAS, _build_has, _apply_has
+    elif constraint.is_links():
+        return KIND_LINKS, _build_links, _apply_links
+    elif constraint.is_sub():
+        return KIND_SUB, _build_sub, _apply_sub
+    elif constraint.is_owns():
+        return KIND_OWNS, _build_owns, _apply_owns
+    elif constraint.is_relates():
+        return KIND_RELATES, _build_relates, _apply_relates
+    elif constraint.is_plays():
+        return KIND_PLAYS, _build_plays, _apply_plays
+    elif constraint.is_function_call():
+        return KIND_FUNCTION_CALL, _build_function_call, _apply_function_call
+    elif constraint.is_expression():
+        return KIND_EXPRESSION, _build_expression, _apply_expression
+    elif constraint.is_is():
+        return KIND_IS, _build_is, _apply_is
+    elif constraint.is_iid():
+        return KIND_IID, _build_iid, _apply_iid
+    elif constraint.is_comparison():
+        return KIND_COMPARISON, _build_comparison, _apply_comparison
+    elif constraint.is_kind_of():
+        return KIND_KIND_OF, _build_kind, _apply_kind
+    elif constraint.is_label():
+        return KIND_LABEL, _build_label, _apply_label
+    elif constraint.is_value():
+        return KIND_VALUE, _build_value, _apply_value
+    elif constraint.is_or() or constraint.is_not() or constraint.is_try():
+        return None  # We're not interested in the structure in this case
+    else:
+        raise TypeError("Unsupported constraint variant: %s" % (type(constraint),))
+
+
+# Dispatch table keyed on the driver's concrete constraint class, populated lazily
+# by _probe_handler so we stay agnostic of which classes the driver exposes.
+# Entries are (KIND tag, build handler, apply handler), or None for or/not/try.
+_DISPATCH: dict = {}
+
+
+# Constraint kind tags: one per DataConstraint subclass. A class-level int
+# lets hot paths dispatch on `constraint.KIND` with a single compare or dict
+# lookup instead of a chain of is_* method calls.
+(KIND_ISA, KIND_HAS, KIND_LINKS, KIND_SUB, KIND_OWNS, KIND_RELATES, KIND_PLAYS,
+ KIND_FUNCTION_CALL, KIND_EXPRESSION, KIND_IS, KIND_IID, KIND_COMPARISON,
+ KIND_KIND_OF, KIND_LABEL, KIND_VALUE) = range(15)
+
+
 class DataConstraint(ABC):
     """
     The pattern in the database that matched the TypeQLConstraint
     """
 
+    __slots__ = ("pipeline_constraint", "answer_index")
+
+    KIND: int
+
     def __init__(self, pipeline_constraint: Constraint, answer_index: Optional[int]):
         self.pipeline_constraint = pipeline_constraint
         self.answer_index = answer_index
 
     @staticmethod
     def of(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
-           concept_row: ConceptRow) -> Optional["DataConstraint"]:
-        if constraint.is_isa():
-            isa = constraint.as_isa()
-            instance = resolve_constraint_vertex(pipeline, isa.instance(), concept_row)
-            type_ = resolve_constraint_vertex(pipeline, isa.type(), concept_row)
-            exactness = isa.exactness()
-            return Isa(constraint, answer_index, instance, type_, exactness)
-
-        elif constraint.is_has():
-            has = constraint.as_has()
-            owner = resolve_constraint_vertex(pipeline, has.owner(), concept_row)
-            attribute = resolve_constraint_vertex(pipeline, has.attribute(), concept_row)
-            exactness = has.exactness()
-            return Has(constraint, answer_index, owner, attribute, exactness)
-
-        elif constraint.is_links():
-            links = constraint.as_links()
-            relation = resolve_constraint_vertex(pipeline, links.relation(), concept_row)
-            player = resolve_constraint_vertex(pipeline, links.player(), concept_row)
-            role = resolve_constraint_vertex(pipeline, links.role(), concept_row)
-            exactness = links.exactness()
-            return Links(constraint, answer_index, relation, player, role, exactness)
-
-        elif constraint.is_sub():
-            sub = constraint.as_sub()
-            subtype = resolve_constraint_vertex(pipeline, sub.subtype(), concept_row)
-            supertype = resolve_constraint_vertex(pipeline, sub.supertype(), concept_row)
-            exactness = sub.exactness()
-            return Sub(constraint, answer_index, subtype, supertype, exactness)
-
-        elif constraint.is_owns():
-            owns = constraint.as_owns()
-            owner = resolve_constraint_vertex(pipeline, owns.owner(), concept_row)
-            attribute = resolve_constraint_vertex(pipeline, owns.attribute(), concept_row)
-            exactness = owns.exactness()
-            return Owns(constraint, answer_index, owner, attribute, exactness)
-
-        elif constraint.is_relates():
-            relates = constraint.as_relates()
-            relation = resolve_constraint_vertex(pipeline, relates.relation(), concept_row)
-            role = resolve_constraint_vertex(pipeline, relates.role(), concept_row)
-            exactness = relates.exactness()
-            return Relates(constraint, answer_index, relation, role, exactness)
-
-        elif constraint.is_plays():
-            plays = constraint.as_plays()
-            player = resolve_constraint_vertex(pipeline, plays.player(), concept_row)
-            role = resolve_constraint_vertex(pipeline, plays.role(), concept_row)
-            exactness = plays.exactness()
-            return Plays(constraint, answer_index, player, role, exactness)
-
-        elif constraint.is_function_call():
-            fc = constraint.as_function_call()
-            name = fc.name()
-            arguments = [resolve_constraint_vertex(pipeline, v, concept_row) for v in fc.arguments()]
-            assigned = [resolve_constraint_vertex(pipeline, v, concept_row) for v in fc.assigned()]
-            fc_vertex = FunctionCallVertex(name, assigned, arguments)
-            return FunctionCall(constraint, answer_index, fc_vertex, arguments, assigned)
-
-        elif constraint.is_expression():
-            expr = constraint.as_expression()
-            text = expr.text()
-            arguments = [resolve_constraint_vertex(pipeline, v, concept_row) for v in expr.arguments()]
-            assigned = resolve_constraint_vertex(pipeline, expr.assigned(), concept_row)
-            expr_vertex = ExpressionVertex(text, assigned, arguments)
-            return Expression(constraint, answer_index, expr_vertex, arguments, assigned)
-
-        elif constraint.is_is():
-            isc = constraint.as_is()
-            lhs = resolve_constraint_vertex(pipeline, isc.lhs(), concept_row)
-            rhs = resolve_constraint_vertex(pipeline, isc.rhs(), concept_row)
-            return Is(constraint, answer_index, lhs, rhs)
-
-        elif constraint.is_iid():
-            iid = constraint.as_iid()
-            variable = resolve_constraint_vertex(pipeline, iid.variable(), concept_row)
-            iid_value = iid.iid()
-            return Iid(constraint, answer_index, variable, iid_value)
-
-        elif constraint.is_comparison():
-            comp = constraint.as_comparison()
-            lhs = resolve_constraint_vertex(pipeline, comp.lhs(), concept_row)
-            rhs = resolve_constraint_vertex(pipeline, comp.rhs(), concept_row)
-            comparator = comp.comparator()
-            return Comparison(constraint, answer_index, lhs, rhs, comparator)
-
-        elif constraint.is_kind_of():
-            kindc = constraint.as_kind()
-            kind_enum = kindc.kind()
-            type_ = resolve_constraint_vertex(pipeline, kindc.type(), concept_row)
-            return Kind(constraint, answer_index, kind_enum, type_)
-
-        elif constraint.is_label():
-            label = constraint.as_label()
-            variable = resolve_constraint_vertex(pipeline, label.variable(), concept_row)
-            label_value = label.label()
-            return Label(constraint, answer_index, variable, label_value)
-
-        elif constraint.is_value():
-            val = constraint.as_value()
-            attribute_type = resolve_constraint_vertex(pipeline, val.attribute_type(), concept_row)
-            value_type = val.value_type()
-            return Value(constraint, answer_index, attribute_type, value_type)
-        elif constraint.is_or() or constraint.is_not() or constraint.is_try():
-            return None  # We're not interested in the structure in this case
-        else:
-            raise TypeError("Unsupported constraint variant: %s" % (type(constraint),))
+           concept_row: ConceptRow, cache: Optional[dict] = None,
+           names: Optional[dict] = None,
+           interested: Optional[frozenset] = None) -> Optional["DataConstraint"]:
+        constraint_class = type(constraint)
+        try:
+            entry = _DISPATCH[constraint_class]
+        except KeyError:
+            entry = _DISPATCH[constraint_class] = _probe_handler(constraint)
+        if entry is None:
+            return None
+        kind, build, _ = entry
+        if interested is not None and kind not in interested:
+            return None
+        return build(pipeline, constraint, answer_index, concept_row, cache, names)
+
+    @staticmethod
+    def apply_to(pipeline: Pipeline, constraint: Constraint, answer_index: Optional[int],
+                 concept_row: ConceptRow, builder, cache: Optional[dict] = None,
+                 names: Optional[dict] = None, interested: Optional[frozenset] = None):
+        """
+        Resolves a constraint and feeds it straight to the builder's apply_*
+        hook, without materializing the intermediate DataConstraint object.
+        Fast path for build-only consumers; `of` remains for callers that want
+        the objects.
+        """
+        constraint_class = type(constraint)
+        try:
+            entry = _DISPATCH[constraint_class]
+        except KeyError:
+            entry = _DISPATCH[constraint_class] = _probe_handler(constraint)
+        if entry is None:
+            return
+        kind, _, apply = entry
+        if interested is not None and kind not in interested:
+            return
+        apply(pipeline, constraint, answer_index, concept_row, builder, cache, names)
 
     def is_isa(self) -> bool:
-        return False
+        return self.KIND == KIND_ISA
 
     def is_has(self) -> bool:
-        return False
+        return self.KIND == KIND_HAS
 
     def is_links(self) -> bool:
-        return False
+        return self.KIND == KIND_LINKS
 
     def is_sub(self) -> bool:
-        return False
+        return self.KIND == KIND_SUB
 
     def is_owns(self) -> bool:
-        return False
+        return self.KIND == KIND_OWNS
 
     def is_relates(self) -> bool:
-        return False
+        return self.KIND == KIND_RELATES
 
     def is_plays(self) -> bool:
-        return False
+        return self.KIND == KIND_PLAYS
 
     def is_function_call(self) -> bool:
-        return False
+        return self.KIND == KIND_FUNCTION_CALL
 
     def is_expression(self) -> bool:
-        return False
+        return self.KIND == KIND_EXPRESSION
 
     def is_is(self) -> bool:
-        return False
+        return self.KIND == KIND_IS
 
     def is_iid(self) -> bool:
-        return False
+        return self.KIND == KIND_IID
 
     def is_comparison(self) -> bool:
-        return False
+        return self.KIND == KIND_COMPARISON
 
     def is_kind_of(self) -> bool:
-        return False
+        return self.KIND == KIND_KIND_OF
 
     def is_label(self) -> bool:
-        return False
+        return self.KIND == KIND_LABEL
 
     def is_value(self) -> bool:
-        return False
+        return self.KIND == KIND_VALUE
 
     def as_isa(self) -> "Isa":
         raise TypeError("Bad cast. Expected: 'Isa'; was: '%s'" % (self.__class__.__name__,))
@@ -329,6 +664,10 @@ class DataConstraint(ABC):
 
 
 class Isa(DataConstraint):
+    __slots__ = ("_instance", "_type", "_exactness")
+
+    KIND = KIND_ISA
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], instance: ConceptVertex, type_: ConceptVertex,
                  exactness):
         super().__init__(constraint, answer_index)
@@ -336,9 +675,6 @@ class Isa(DataConstraint):
         self._type = type_
         self._exactness = exactness
 
-    def is_isa(self) -> bool:
-        return True
-
     def as_isa(self):
         return self
 
@@ -353,6 +689,10 @@ class Isa(DataConstraint):
 
 
 class Has(DataConstraint):
+    __slots__ = ("_owner", "_attribute", "_exactness")
+
+    KIND = KIND_HAS
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], owner: ConceptVertex, attribute: ConceptVertex,
                  exactness):
         super().__init__(constraint, answer_index)
@@ -360,9 +700,6 @@ class Has(DataConstraint):
         self._attribute = attribute
         self._exactness = exactness
 
-    def is_has(self) -> bool:
-        return True
-
     def as_has(self):
         return self
 
@@ -377,6 +714,10 @@ class Has(DataConstraint):
 
 
 class Links(DataConstraint):
+    __slots__ = ("_relation", "_player", "_role", "_exactness")
+
+    KIND = KIND_LINKS
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], relation: ConceptVertex, player: ConceptVertex,
                  role: DataVertex, exactness):
         super().__init__(constraint, answer_index)
@@ -385,9 +726,6 @@ class Links(DataConstraint):
         self._role = role
         self._exactness = exactness
 
-    def is_links(self) -> bool:
-        return True
-
     def as_links(self):
         return self
 
@@ -405,6 +743,10 @@ class Links(DataConstraint):
 
 
 class Sub(DataConstraint):
+    __slots__ = ("_subtype", "_supertype", "_exactness")
+
+    KIND = KIND_SUB
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], subtype: ConceptVertex, supertype: ConceptVertex,
                  exactness):
         super().__init__(constraint, answer_index)
@@ -412,9 +754,6 @@ class Sub(DataConstraint):
         self._supertype = supertype
         self._exactness = exactness
 
-    def is_sub(self) -> bool:
-        return True
-
     def as_sub(self):
         return self
 
@@ -429,6 +768,10 @@ class Sub(DataConstraint):
 
 
 class Owns(DataConstraint):
+    __slots__ = ("_owner", "_attribute", "_exactness")
+
+    KIND = KIND_OWNS
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], owner: ConceptVertex, attribute: ConceptVertex,
                  exactness):
         super().__init__(constraint, answer_index)
@@ -436,9 +779,6 @@ class Owns(DataConstraint):
         self._attribute = attribute
         self._exactness = exactness
 
-    def is_owns(self) -> bool:
-        return True
-
     def as_owns(self):
         return self
 
@@ -453,6 +793,10 @@ class Owns(DataConstraint):
 
 
 class Relates(DataConstraint):
+    __slots__ = ("_relation", "_role", "_exactness")
+
+    KIND = KIND_RELATES
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], relation: ConceptVertex, role: DataVertex,
                  exactness):
         super().__init__(constraint, answer_index)
@@ -460,9 +804,6 @@ class Relates(DataConstraint):
         self._role = role
         self._exactness = exactness
 
-    def is_relates(self) -> bool:
-        return True
-
     def as_relates(self):
         return self
 
@@ -477,15 +818,16 @@ class Relates(DataConstraint):
 
 
 class Plays(DataConstraint):
+    __slots__ = ("_player", "_role", "_exactness")
+
+    KIND = KIND_PLAYS
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], player: ConceptVertex, role: ConceptVertex, exactness):
         super().__init__(constraint, answer_index)
         self._player = player
         self._role = role
         self._exactness = exactness
 
-    def is_plays(self) -> bool:
-        return True
-
     def as_plays(self):
         return self
 
@@ -500,6 +842,10 @@ class Plays(DataConstraint):
 
 
 class FunctionCall(DataConstraint):
+    __slots__ = ("_call_vertex", "_arguments", "_assigned")
+
+    KIND = KIND_FUNCTION_CALL
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], call_vertex: FunctionCallVertex,
                  arguments: List[ConceptVertex], assigned: List[ConceptVertex]):
         super().__init__(constraint, answer_index)
@@ -507,9 +853,6 @@ class FunctionCall(DataConstraint):
         self._arguments = arguments
         self._assigned = assigned
 
-    def is_function_call(self) -> bool:
-        return True
-
     def as_function_call(self):
         return self
 
@@ -524,6 +867,10 @@ class FunctionCall(DataConstraint):
 
 
 class Expression(DataConstraint):
+    __slots__ = ("_expr", "_arguments", "_assigned")
+
+    KIND = KIND_EXPRESSION
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], expr: ExpressionVertex,
                  arguments: List[ConceptVertex], assigned: ConceptVertex):
         super().__init__(constraint, answer_index)
@@ -531,9 +878,6 @@ class Expression(DataConstraint):
         self._arguments = arguments
         self._assigned = assigned
 
-    def is_expression(self) -> bool:
-        return True
-
     def as_expression(self):
         return self
 
@@ -548,14 +892,15 @@ class Expression(DataConstraint):
 
 
 class Is(DataConstraint):
+    __slots__ = ("_lhs", "_rhs")
+
+    KIND = KIND_IS
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], lhs: ConceptVertex, rhs: ConceptVertex):
         super().__init__(constraint, answer_index)
         self._lhs = lhs
         self._rhs = rhs
 
-    def is_is(self) -> bool:
-        return True
-
     def as_is(self):
         return self
 
@@ -567,14 +912,15 @@ class Is(DataConstraint):
 
 
 class Iid(DataConstraint):
+    __slots__ = ("_variable", "_iid")
+
+    KIND = KIND_IID
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], variable: ConceptVertex, iid_value: str):
         super().__init__(constraint, answer_index)
         self._variable = variable
         self._iid = iid_value
 
-    def is_iid(self) -> bool:
-        return True
-
     def as_iid(self):
         return self
 
@@ -586,15 +932,16 @@ class Iid(DataConstraint):
 
 
 class Comparison(DataConstraint):
+    __slots__ = ("_lhs", "_rhs", "_comparator")
+
+    KIND = KIND_COMPARISON
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], lhs: ConceptVertex, rhs: ConceptVertex, comparator):
         super().__init__(constraint, answer_index)
         self._lhs = lhs
         self._rhs = rhs
         self._comparator = comparator
 
-    def is_comparison(self) -> bool:
-        return True
-
     def as_comparison(self):
         return self
 
@@ -609,14 +956,15 @@ class Comparison(DataConstraint):
 
 
 class Kind(DataConstraint):
+    __slots__ = ("_kind", "_type")
+
+    KIND = KIND_KIND_OF
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], kind_enum, type_: ConceptVertex):
         super().__init__(constraint, answer_index)
         self._kind = kind_enum
         self._type = type_
 
-    def is_kind_of(self) -> bool:
-        return True
-
     def as_kind(self):
         return self
 
@@ -628,14 +976,15 @@ class Kind(DataConstraint):
 
 
 class Label(DataConstraint):
+    __slots__ = ("_variable", "_label")
+
+    KIND = KIND_LABEL
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], variable: ConceptVertex, label_value: str):
         super().__init__(constraint, answer_index)
         self._variable = variable
         self._label = label_value
 
-    def is_label(self) -> bool:
-        return True
-
     def as_label(self):
         return self
 
@@ -647,14 +996,15 @@ class Label(DataConstraint):
 
 
 class Value(DataConstraint):
+    __slots__ = ("_attribute_type", "_value_type")
+
+    KIND = KIND_VALUE
+
     def __init__(self, constraint: Constraint, answer_index: Optional[int], attribute_type: ConceptVertex, value_type: str):
         super().__init__(constraint, answer_index)
         self._attribute_type = attribute_type
         self._value_type = value_type
 
-    def is_value(self) -> bool:
-        return True
-
     def as_value(self):
         return self
 
@@ -10,73 +10,162 @@ from .data_constraint import (
     Isa, Has, Links, Is, Iid,
     Sub, Owns, Relates, Plays, Label, Kind, Value,
     Expression, FunctionCall, Comparison,
-    ConceptVertex, NamedRoleVertex,
+    ConceptVertex, NamedRoleVertex, DataVertex,
+    KIND_ISA, KIND_HAS, KIND_LINKS, KIND_SUB, KIND_OWNS, KIND_RELATES, KIND_PLAYS,
+    KIND_FUNCTION_CALL, KIND_EXPRESSION,
 )
 
 
+# Shared edge-attribute dicts, one per (edge kind, exactness). add_edge copies
+# attributes into the graph's own dict, so reusing these is safe and avoids a
+# fresh dict literal per edge.
+_EDGE_ATTRS = {label: {"label": label} for label in (
+    "isa", "isa!", "has", "has!", "sub", "sub!", "owns", "owns!",
+    "relates", "relates!", "plays", "plays!",
+)}
+
+
 class NetworkXBuilder(TypeDBAnswerConverter[MultiDiGraph]):
+    # add_kind/add_label/add_value/add_is/add_iid/add_comparison are no-ops, so
+    # constraints of those kinds are not worth building at all.
+    INTERESTED_KINDS = frozenset({
+        KIND_ISA, KIND_HAS, KIND_LINKS, KIND_SUB, KIND_OWNS, KIND_RELATES,
+        KIND_PLAYS, KIND_FUNCTION_CALL, KIND_EXPRESSION,
+    })
 
     def __init__(self, pipeline: Pipeline):
         super().__init__(pipeline)
-        self.graph = MultiDiGraph()
+        # Edges accumulate in parallel append-only lists and become a
+        # MultiDiGraph only in finish(): list appends are much cheaper than
+        # per-edge dict-of-dict inserts, and nothing queries the partial graph.
+        self._edges: set = set()  # (u, v) endpoint pairs already buffered
+        self._edge_u: list = []
+        self._edge_v: list = []
+        self._edge_attrs: list = []
+        # Per variable name: the assign[...]/arg[...] attribute dicts repeat for
+        # every row, so build each once and share (add_edge copies attributes).
+        self._assign_edge_attrs: dict = {}
+        self._arg_edge_attrs: dict = {}
+        # Per role vertex: label extraction goes through the driver, and a
+        # pipeline only has a handful of distinct roles.
+        self._role_edge_attrs: dict = {}
 
     def finish(self) -> MultiDiGraph:
-        return self.graph
+        graph = MultiDiGraph()
+        graph.add_edges_from(zip(self._edge_u, self._edge_v, self._edge_attrs))
+        return graph
+
+    # The apply_* overrides draw straight from the resolved fields;
+    # DataConstraint.apply_to routes here without building the intermediate
+    # object. The add_* methods below delegate so the object API still works.
+    def apply_isa(self, constraint, answer_index, instance, type_, exactness):
+        if instance is None or type_ is None or constraint.type().is_label():
+            return
+        edge_type = "isa!" if exactness == ConstraintExactness.Exact else "isa"
+        self._may_add_edge(instance, type_, _EDGE_ATTRS[edge_type])
 
-    def add_isa(self, isa: Isa):
-        if isa.instance() is None or isa.type() is None or isa.pipeline_constraint.type().is_label():
+    def apply_has(self, constraint, answer_index, owner, attribute, exactness):
+        if owner is None or attribute is None:
             return
-        edge_type = "isa!" if isa.exactness() == ConstraintExactness.Exact else "isa"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(isa.instance(), isa.type(), edge_attributes)
+        edge_type = "has!" if exactness == ConstraintExactness.Exact else "has"
+        self._may_add_edge(owner, attribute, _EDGE_ATTRS[edge_type])
 
-    def add_has(self, has: Has):
-        if has.owner() is None or has.attribute() is None:
+    def apply_links(self, constraint, answer_index, relation, player, role, exactness):
+        if relation is None or player is None:
             return
-        edge_type = "has!" if has.exactness() == ConstraintExactness.Exact else "has"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(has.owner(), has.attribute(), edge_attributes)
+        edge_attributes = self._role_edge_attrs.get(role)
+        if edge_attributes is None:
+            if isinstance(role, ConceptVertex):
+                role_label = role.concept.get_label()
+            elif isinstance(role, NamedRoleVertex):
+                role_label = role.name()
+            else:
+                role_label = None
+            # f-string kept deliberately: a missing role renders as "None",
+            # as it always has.
+            edge_attributes = self._role_edge_attrs[role] = {"label": f"{role_label}"}
+        self._may_add_edge(relation, player, edge_attributes)
+
+    def apply_sub(self, constraint, answer_index, subtype, supertype, exactness):
+        if subtype is None or supertype is None:
+            return
+        edge_type = "sub!" if exactness == ConstraintExactness.Exact else "sub"
+        self._may_add_edge(subtype, supertype, _EDGE_ATTRS[edge_type])
 
-    def add_links(self, links: Links):
-        if links.relation() is None or links.player() is None:
+    def apply_owns(self, constraint, answer_index, owner, attribute, exactness):
+        if owner is None or attribute is None:
             return
-        if isinstance(links.role(), ConceptVertex):
-            role_label = links.role().concept.get_label()
-        elif isinstance(links.role(), NamedRoleVertex):
-            role_label = links.role().name()
-        else:
-            role_label = None
-        edge_type = f"{role_label}"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(links.relation(), links.player(), edge_attributes)
+        edge_type = "owns!" if exactness == ConstraintExactness.Exact else "owns"
+        self._may_add_edge(owner, attribute, _EDGE_ATTRS[edge_type])
 
-    def add_sub(self, sub: Sub):
-        if sub.subtype() is None or sub.supertype() is None:
+    def apply_relates(self, constraint, answer_index, relation, role, exactness):
+        if relation is None or role is None:
             return
-        edge_type = "sub!" if sub.exactness() == ConstraintExactness.Exact else "sub"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(sub.subtype(), sub.supertype(), edge_attributes)
+        edge_type = "relates!" if exactness == ConstraintExactness.Exact else "relates"
+        self._may_add_edge(relation, role, _EDGE_ATTRS[edge_type])
 
-    def add_owns(self, owns: Owns):
-        if owns.owner() is None or owns.attribute() is None:
+    def apply_plays(self, constraint, answer_index, player, role, exactness):
+        if player is None or role is None:
             return
-        edge_type = "owns!" if owns.exactness() == ConstraintExactness.Exact else "owns"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(owns.owner(), owns.attribute(), edge_attributes)
+        edge_type = "plays!" if exactness == ConstraintExactness.Exact else "plays"
+        self._may_add_edge(player, role, _EDGE_ATTRS[edge_type])
 
-    def add_relates(self, relates: Relates):
-        if relates.relation() is None or relates.role() is None:
+    def apply_expression(self, constraint, answer_index, expr_vertex, arguments, assigned):
+        # Note: a nullary expression (e.g. `let $y = 3`) still draws its assign
+        # edge; only a missing assignment makes the whole constraint undrawable.
+        if assigned is None:
+            return
+        may_add_edge = self._may_add_edge
+        # Assigned edge:
+        assigned_var_name = self._variable_name(constraint.assigned().as_variable())
+        may_add_edge(expr_vertex, assigned, self._assign_attrs(assigned_var_name))
+
+        # The driver hands out one-shot iterators here; materialize before indexing.
+        pipeline_args = list(constraint.arguments())
+        for i in range(len(arguments)):
+            arg_var_name = self._variable_name(pipeline_args[i].as_variable())
+            may_add_edge(arguments[i], expr_vertex, self._arg_attrs(arg_var_name))
+
+    def apply_function_call(self, constraint, answer_index, call_vertex, arguments, assigned):
+        # We refrain from drawing when there is nothing to connect
+        if not assigned and not arguments:
             return
-        edge_type = "relates!" if relates.exactness() == ConstraintExactness.Exact else "relates"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(relates.relation(), relates.role(), edge_attributes)
+        may_add_edge = self._may_add_edge
+        # The driver hands out one-shot iterators here; materialize before indexing.
+        # Assigned edge:
+        pipeline_assigned = list(constraint.assigned())
+        for i in range(len(assigned)):
+            assigned_var_name = self._variable_name(pipeline_assigned[i].as_variable())
+            may_add_edge(call_vertex, assigned[i], self._assign_attrs(assigned_var_name))
+
+        pipeline_args = list(constraint.arguments())
+        for i in range(len(arguments)):
+            arg_var_name = self._variable_name(pipeline_args[i].as_variable())
+            may_add_edge(arguments[i], call_vertex, self._arg_attrs(arg_var_name))
+
+    def add_isa(self, isa: Isa):
+        self.apply_isa(isa.pipeline_constraint, isa.answer_index, isa.instance(), isa.type(), isa.exactness())
+
+    def add_has(self, has: Has):
+        self.apply_has(has.pipeline_constraint, has.answer_index, has.owner(), has.attribute(), has.exactness())
+
+    def add_links(self, links: Links):
+        self.apply_links(links.pipeline_constraint, links.answer_index, links.relation(), links.player(),
+                         links.role(), links.exactness())
+
+    def add_sub(self, sub: Sub):
+        self.apply_sub(sub.pipeline_constraint, sub.answer_index, sub.subtype(), sub.supertype(), sub.exactness())
+
+    def add_owns(self, owns: Owns):
+        self.apply_owns(owns.pipeline_constraint, owns.answer_index, owns.owner(), owns.attribute(), owns.exactness())
+
+    def add_relates(self, relates: Relates):
+        self.apply_relates(relates.pipeline_constraint, relates.answer_index, relates.relation(), relates.role(),
+                           relates.exactness())
 
     def add_plays(self, plays: Plays):
-        if plays.player() is None or plays.role() is None:
-            return
-        edge_type = "plays!" if plays.exactness() == ConstraintExactness.Exact else "plays"
-        edge_attributes = {"label": edge_type}
-        self._may_add_edge(plays.player(), plays.role(), edge_attributes)
+        self.apply_plays(plays.pipeline_constraint, plays.answer_index, plays.player(), plays.role(),
+                         plays.exactness())
 
     def add_kind(self, kind: Kind):
         pass
@@ -88,32 +177,12 @@ class NetworkXBuilder(TypeDBAnswerConverter[MultiDiGraph]):
         pass
 
     def add_expression(self, expr: Expression):
-        if expr.assigned() is None or 0 == len(expr.arguments()) is None:
-            return
-        # Assigned edge:
-        assigned_var_name = self.pipeline.get_variable_name(expr.pipeline_constraint.assigned().as_variable())
-        assign_edge_attrs = {"label": f"assign[{assigned_var_name}]", "var": assigned_var_name}
-        self._may_add_edge(expr.expression_vertex(), expr.assigned(), assign_edge_attrs)
-
-        for (arg, arg_var) in zip(expr.arguments(), expr.pipeline_constraint.arguments()):
-            arg_var_name = self.pipeline.get_variable_name(arg_var.as_variable())
-            arg_edge_attributes = {"label": f"arg[{arg_var_name}]", "var": arg_var_name}
-            self._may_add_edge(arg, expr.expression_vertex(), arg_edge_attributes)
+        self.apply_expression(expr.pipeline_constraint, expr.answer_index, expr.expression_vertex(),
+                              expr.arguments(), expr.assigned())
 
     def add_function_call(self, fc: FunctionCall):
-        # We refrain from drawing
-        if 0 == len(fc.assigned()) is None or 0 == len(fc.arguments()) is None:
-            return
-        # Assigned edge:
-        for (assigned, assigned_var) in zip(fc.assigned(), fc.pipeline_constraint.assigned()):
-            assigned_var_name = self.pipeline.get_variable_name(assigned_var.as_variable())
-            assign_edge_attrs = {"label": f"assign[{assigned_var_name}]", "var": assigned_var_name}
-            self._may_add_edge(fc.call_vertex(), assigned, assign_edge_attrs)
-
-        for (arg, arg_var) in zip(fc.arguments(), fc.pipeline_constraint.arguments()):
-            arg_var_name = self.pipeline.get_variable_name(arg_var.as_variable())
-            arg_edge_attributes = {"label": f"arg[{arg_var_name}]", "var": arg_var_name}
-            self._may_add_edge(arg, fc.call_vertex(), arg_edge_attributes)
+        self.apply_function_call(fc.pipeline_constraint, fc.answer_index, fc.call_vertex(),
+                                 fc.arguments(), fc.assigned())
 
     def add_is(self, is_c: Is):
         pass
@@ -125,12 +194,26 @@ class NetworkXBuilder(TypeDBAnswerConverter[MultiDiGraph]):
         pass  # We prefer not to
 
     # Helpers
-    def _may_add_node(self, node):
-        if not self.graph.has_node(node):
-            self.graph.add_node(node)
-
-    def _may_add_edge(self, u, v, attributes: Dict[str, str]):
-        if not self.graph.has_edge(u, v):
-            self._may_add_node(u)
-            self._may_add_node(v)
-            self.graph.add_edge(u, v, **attributes)
+    def _assign_attrs(self, var_name: str) -> Dict[str, str]:
+        attrs = self._assign_edge_attrs.get(var_name)
+        if attrs is None:
+            attrs = self._assign_edge_attrs[var_name] = {"label": f"assign[{var_name}]", "var": var_name}
+        return attrs
+
+    def _arg_attrs(self, var_name: str) -> Dict[str, str]:
+        attrs = self._arg_edge_attrs.get(var_name)
+        if attrs is None:
+            attrs = self._arg_edge_attrs[var_name] = {"label": f"arg[{var_name}]", "var": var_name}
+        return attrs
+
+    def _may_add_edge(self, u: DataVertex, v: DataVertex, attributes: Dict[str, str]):
+        # Dedup keyed on the vertices (cached hashes) so equal-but-distinct
+        # expression/function-call vertices still dedup correctly.
+        key = (u, v)
+        edges = self._edges
+        if key in edges:
+            return
+        edges.add(key)
+        self._edge_u.append(u)
+        self._edge_v.append(v)
+        self._edge_attrs.append(attributes)